@@ -2,10 +2,21 @@ import sys
 import os
 import time
 import re
+import functools
+import asyncio
+import threading
+from collections import deque, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse, unquote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.etree
+import lxml.html
+from urllib.parse import urljoin, urlparse, urlunparse, unquote
 import shutil # For checking disk space
+from html import escape as html_escape
+
+import url_utils
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -13,19 +24,24 @@ from PyQt6.QtWidgets import (
     QSplitter, QFrame, QDialog, QFormLayout, QRadioButton, QGroupBox,
     QMessageBox, QFileDialog, QTabWidget, QCheckBox, QSpinBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QDir, QTimer, QUrl
-from PyQt6.QtGui import QFileSystemModel, QIcon, QColor, QPalette, QFont
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QDir, QTimer, QUrl, QElapsedTimer, QEventLoop
+from PyQt6.QtGui import QFileSystemModel, QIcon, QColor, QPalette, QFont, QPixmap
+
+# Optional aiohttp import for concurrent asset downloads
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
 
-# Optional Selenium Imports
+# Optional Playwright import for JS-rendered pages. One persistent Chromium
+# process serves the whole crawl (Selenium + ChromeDriverManager paid a
+# multi-second driver download/spawn on every run).
 try:
-    from selenium import webdriver
-    from selenium.webdriver.chrome.service import Service as ChromeService
-    from selenium.webdriver.chrome.options import Options as ChromeOptions
-    from webdriver_manager.chrome import ChromeDriverManager
-    from selenium.common.exceptions import WebDriverException, TimeoutException
-    SELENIUM_AVAILABLE = True
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
 except ImportError:
-    SELENIUM_AVAILABLE = False
+    PLAYWRIGHT_AVAILABLE = False
 
 # --- Application Constants ---
 APP_NAME = "WebClonerPy"
@@ -34,18 +50,93 @@ DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.
 DEFAULT_DOCS_SUBDIR = "My Cloned Websites" # For auto-path suggestion
 
 # --- Helper Functions ---
+# Built once at import: sanitize_filename runs for every path segment of every
+# URL/asset, so avoid recompiling patterns (or even entering the regex engine
+# for the character replacement — str.translate is pure C).
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'} | {chr(i): '_' for i in range(32)})
+_SANITIZE_UNDERSCORES = re.compile(r'_+')
+
+# O(1) extension lookups for the per-link asset/page classification (compared
+# against path.rpartition('.')[2].lower(), i.e. the final suffix without dot).
+_ASSET_EXTS = frozenset({
+    'css', 'js', 'png', 'jpg', 'jpeg', 'gif', 'svg', 'webp', 'ico', 'json',
+    'woff', 'woff2', 'ttf', 'otf', 'eot',
+    'mp4', 'webm', 'ogg', 'mp3',
+    'pdf', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'xml', 'txt'})
+_HTML_EXTS = frozenset({'html', 'htm', 'php'})
+
+# URL-carrying attributes the cloner rewrites, per tag.
+_TAG_ATTRS = {
+    'a': ('href',), 'link': ('href',), 'iframe': ('src',), 'embed': ('src',),
+    'object': ('data',), 'img': ('src', 'srcset', 'data-src'),
+    'script': ('src',), 'source': ('src',), 'form': ('action',),
+}
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(filename):
-    filename = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
-    filename = re.sub(r'_+', '_', filename)
+    filename = filename.translate(_SANITIZE_TABLE)
+    filename = _SANITIZE_UNDERSCORES.sub('_', filename)
     filename = filename.strip('_ ')
     if not filename:
         filename = "untitled"
     max_len = 200 # Max filename length, be conservative
     return filename[:max_len]
 
+def _open_sequential(path):
+    """Open *path* for writing with sequential-access hints.
+
+    Tells the kernel the data will be written once and not re-read, so bulk
+    asset writes don't evict hotter pages from the page cache. Falls back to
+    a plain binary open where the hints aren't available.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    if hasattr(os, 'O_BINARY'):
+        flags |= os.O_BINARY
+    if hasattr(os, 'O_SEQUENTIAL'):
+        flags |= os.O_SEQUENTIAL
+    fd = os.open(path, flags, 0o644)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError):
+        pass
+    return os.fdopen(fd, 'wb')
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_html_response(content_type, suffix, has_trailing_slash):
+    """Content-Type/extension dispatch for the per-URL HTML decision.
+
+    Cached because pages from the same CMS repeat identical header/suffix
+    combinations; the byte sniff stays outside as the last resort.
+    """
+    if content_type:
+        return 'text/html' in content_type.lower()
+    return suffix in _HTML_EXTS or has_trailing_slash
+
+
+def _parse_srcset(value):
+    """Split a srcset attribute into (url, descriptor) pairs, one split per candidate."""
+    parts = []
+    for candidate in value.split(','):
+        candidate = candidate.strip()
+        if not candidate:
+            continue
+        url, _, descriptor = candidate.partition(' ')
+        parts.append((url, descriptor.strip()))
+    return parts
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_page_url(url):
+    """Visited-set key: strip the fragment so '/page' and '/page#section'
+    are recognized as the same page."""
+    p = urlparse(url)
+    return urlunparse((p.scheme, p.netloc, p.path, '', p.query, ''))
+
+
 def get_domain(url):
     try:
-        return urlparse(url).netloc
+        return url_utils.parse(url).netloc
     except ValueError: # Handle potential errors with malformed URLs early
         return "invalid_domain"
 
@@ -66,8 +157,31 @@ def get_default_save_path(url):
 
 
 # --- Worker Thread for Cloning ---
+def _build_session(headers, proxy_settings=None):
+    """Build the pooled requests.Session used for a whole clone.
+
+    Shared by the GUI (which owns the session's lifetime) and by workers
+    constructed without one.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    # Keep TCP+TLS connections alive across the many same-origin fetches of a
+    # crawl; the default adapter pools only 10 connections per host.
+    adapter = HTTPAdapter(
+        pool_connections=32, pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.3,
+                          status_forcelist=[429, 500, 502, 503, 504]))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if proxy_settings and (proxy_settings.get('http') or proxy_settings.get('https')):
+        session.proxies.update(proxy_settings)
+    return session
+
+
 class ClonerWorker(QThread):
-    log_message = pyqtSignal(str, QColor)
+    # Log lines are buffered and emitted in batches of (message, QColor) tuples:
+    # one queued cross-thread dispatch per batch instead of per line.
+    log_batch = pyqtSignal(list)
     progress_updated = pyqtSignal(int)
     status_updated = pyqtSignal(int, float, float)
     file_saved = pyqtSignal(str)
@@ -75,174 +189,452 @@ class ClonerWorker(QThread):
     page_content_downloaded = pyqtSignal(str, str)
 
     def __init__(self, base_url, dest_path, clone_type="recursive", headers=None,
-                 use_selenium=False, selenium_timeout=30, request_delay=1, proxy_settings=None,
-                 max_depth=5, parent=None):
+                 use_renderer=False, render_timeout=30, request_delay=1, proxy_settings=None,
+                 max_depth=5, max_workers=16, stagger_ms=100, session=None,
+                 base_parsed=None, parent=None):
         super().__init__(parent)
         self.base_url = base_url
-        self.dest_path = dest_path # This is the root for THIS clone, e.g., .../My Cloned Websites/example_com
+        # start_cloning already parsed the URL for validation; reuse that
+        # result rather than parsing a third time here. Normalized so it
+        # compares equal to per-link domains regardless of which parser
+        # (ada-url vs urllib) produced either side.
+        if base_parsed is not None:
+            self.base_domain = url_utils.normalize_netloc(base_parsed.netloc, base_parsed.scheme)
+        else:
+            self.base_domain = url_utils.normalize_netloc(get_domain(base_url))
+        # Root for THIS clone, e.g., .../My Cloned Websites/example_com.
+        # Normalized to absolute once so every path joined from it is already
+        # absolute and the per-link relpath needs no abspath (getcwd) calls.
+        self.dest_path = os.path.abspath(dest_path)
         self.clone_type = clone_type
         self.headers = headers if headers else {"User-Agent": DEFAULT_USER_AGENT}
-        
-        self.use_selenium = use_selenium and SELENIUM_AVAILABLE
-        self.selenium_timeout = selenium_timeout
+
+        self.use_renderer = use_renderer and PLAYWRIGHT_AVAILABLE
+        self.render_timeout = render_timeout
+        # request_delay is enforced per host, not globally: concurrent fetches
+        # to different hosts never wait on each other.
         self.request_delay = request_delay
+        self.max_workers = max_workers
+        self.stagger_ms = stagger_ms
+        self._host_last = defaultdict(float)
+        self._host_lock = threading.Lock()
+        self._last_status_emit = 0.0  # throttles progress/status signals
         self.proxy_settings = proxy_settings if proxy_settings else {}
         self.max_depth = max_depth
 
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # The GUI builds the session in start_cloning and closes it in
+        # clone_finished_report, so its connection pool outlives the thread
+        # cleanly; a worker constructed standalone builds its own.
+        self.session = session if session is not None else _build_session(self.headers, self.proxy_settings)
         if self.proxy_settings.get('http') or self.proxy_settings.get('https'):
-            self.session.proxies.update(self.proxy_settings)
-            self.log_message.emit(f"Using Requests proxy: {self.proxy_settings}", QColor(Qt.GlobalColor.blue))
+            self._log(f"Using Requests proxy: {self.proxy_settings}", QColor(Qt.GlobalColor.blue))
+        # aiohttp only speaks HTTP proxies; with a socks5:// proxy configured,
+        # asset batches must route through the requests fallback (PySocks).
+        _proxy_str = self.proxy_settings.get('http') or self.proxy_settings.get('https') or ''
+        self._proxy_is_socks = _proxy_str.startswith('socks')
 
         self.visited_urls = set()
+        self.downloaded_assets = set()  # absolute URLs already fetched (or found on disk)
         self.files_downloaded = 0
         self.total_size_bytes = 0
         self.start_time = 0
         self.stop_requested = False
-        self.url_queue = []
-        self.selenium_driver = None
+        self.url_queue = deque()  # popleft() is O(1); list.pop(0) was O(n) per page
+
+        # Playwright renderer state: one browser/context persists for the crawl
+        # (started lazily on the worker's event loop, torn down in run()'s finally)
+        self._playwright = None
+        self._pw_browser = None
+        self._pw_context = None
+
+        self._created_dirs = set()  # dirs already ensured; skips repeat makedirs stats
+
+        self._log_buffer = []
+        self._last_log_flush = 0.0
+
+        # Event loop + session for concurrent asset downloads (set up in run())
+        self._async_loop = None
+        self._aio_session = None
+        self._aio_semaphore = None
+        self._pool = None  # ThreadPoolExecutor fallback when aiohttp is missing
+
+    def _log(self, message, color):
+        self._log_buffer.append((message, color))
+        if len(self._log_buffer) >= 32 or time.monotonic() - self._last_log_flush > 0.05:
+            self._flush_log()
+
+    def _flush_log(self):
+        if self._log_buffer:
+            batch, self._log_buffer = self._log_buffer, []
+            self._last_log_flush = time.monotonic()
+            self.log_batch.emit(batch)
 
     def stop(self):
         self.stop_requested = True
-        self.log_message.emit("Stop request received. Finishing current tasks...", QColor(Qt.GlobalColor.yellow))
-        if self.selenium_driver:
-            try:
-                self.selenium_driver.quit()
-            except Exception as e:
-                self.log_message.emit(f"Error quitting Selenium driver: {e}", QColor(Qt.GlobalColor.red))
+        self._log("Stop request received. Finishing current tasks...", QColor(Qt.GlobalColor.yellow))
 
-    def _init_selenium_driver(self):
-        if not self.use_selenium:
-            return None
+    async def _ensure_renderer(self):
+        if self._pw_context is not None:
+            return True
         try:
-            self.log_message.emit("Initializing Selenium WebDriver (Chrome)...", QColor(Qt.GlobalColor.blue))
-            chrome_options = ChromeOptions()
-            chrome_options.add_argument(f"--user-agent={self.headers.get('User-Agent', DEFAULT_USER_AGENT)}")
-            chrome_options.add_argument("--headless") 
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-
-            proxy_str = None
-            if self.proxy_settings.get('http'):
-                proxy_str = self.proxy_settings['http']
-            elif self.proxy_settings.get('https'):
-                proxy_str = self.proxy_settings['https']
-            
-            if proxy_str:
-                if not proxy_str.startswith(("http://", "https://", "socks5://", "socks4://")):
-                    if self.proxy_settings.get('http') and "://" not in self.proxy_settings.get('http', ''):
-                         proxy_str = "http://" + self.proxy_settings.get('http')
-                    elif self.proxy_settings.get('https') and "://" not in self.proxy_settings.get('https', ''):
-                         proxy_str = "http://" + self.proxy_settings.get('https')
-                
-                chrome_options.add_argument(f'--proxy-server={proxy_str}')
-                self.log_message.emit(f"Using Selenium proxy: {proxy_str}", QColor(Qt.GlobalColor.blue))
-
-            service = ChromeService(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(self.selenium_timeout)
-            self.log_message.emit("Selenium WebDriver initialized.", QColor(Qt.GlobalColor.green))
-            return driver
-        except WebDriverException as e:
-            self.log_message.emit(f"Failed to initialize Selenium WebDriver: {e}. Falling back to requests.", QColor(Qt.GlobalColor.red))
-            self.use_selenium = False 
-            return None
-        except Exception as e: 
-            self.log_message.emit(f"General error initializing Selenium: {e}", QColor(Qt.GlobalColor.red))
-            self.use_selenium = False
-            return None
+            self._log("Starting Playwright (headless Chromium)...", QColor(Qt.GlobalColor.blue))
+            self._playwright = await async_playwright().start()
+            self._pw_browser = await self._playwright.chromium.launch(headless=True)
 
-    def _fetch_page_with_selenium(self, url):
-        if not self.selenium_driver:
-            self.selenium_driver = self._init_selenium_driver()
-            if not self.selenium_driver: return None, None
+            proxy_str = self.proxy_settings.get('http') or self.proxy_settings.get('https')
+            context_args = {'user_agent': self.headers.get('User-Agent', DEFAULT_USER_AGENT)}
+            if proxy_str:
+                if "://" not in proxy_str:
+                    proxy_str = "http://" + proxy_str
+                context_args['proxy'] = {'server': proxy_str}
+                self._log(f"Using Playwright proxy: {proxy_str}", QColor(Qt.GlobalColor.blue))
+
+            self._pw_context = await self._pw_browser.new_context(**context_args)
+            self._log("Playwright browser ready.", QColor(Qt.GlobalColor.green))
+            return True
+        except Exception as e:
+            self._log(f"Failed to start Playwright: {e}. Falling back to requests.", QColor(Qt.GlobalColor.red))
+            self.use_renderer = False
+            await self._close_renderer()
+            return False
+
+    async def _close_renderer(self):
+        for closer in (self._pw_context, self._pw_browser):
+            if closer is not None:
+                try: await closer.close()
+                except Exception: pass
+        if self._playwright is not None:
+            try: await self._playwright.stop()
+            except Exception: pass
+        self._pw_context = self._pw_browser = self._playwright = None
 
+    async def _fetch_page_rendered_async(self, url):
+        if not await self._ensure_renderer():
+            return None, None
         try:
-            self.log_message.emit(f"Fetching (Selenium): {url}", QColor(Qt.GlobalColor.darkCyan))
-            self.selenium_driver.get(url)
-            time.sleep(self.request_delay + 1) # Basic wait for JS, slightly more than request_delay
-            html_content = self.selenium_driver.page_source
-            return html_content.encode('utf-8'), 'utf-8' # Selenium gives decoded string
-        except TimeoutException:
-            self.log_message.emit(f"Selenium timeout loading {url}", QColor(Qt.GlobalColor.red))
+            self._log(f"Fetching (Playwright): {url}", QColor(Qt.GlobalColor.darkCyan))
+            page = await self._pw_context.new_page()
+            try:
+                await page.goto(url, timeout=self.render_timeout * 1000)
+                html_content = await page.content()
+            finally:
+                await page.close()
+            return html_content.encode('utf-8'), 'utf-8' # Playwright gives decoded string
+        except Exception as e:
+            self._log(f"Playwright error fetching {url}: {e}", QColor(Qt.GlobalColor.red))
             return None, None
-        except WebDriverException as e:
-            self.log_message.emit(f"Selenium error fetching {url}: {e}", QColor(Qt.GlobalColor.red))
-            if self.selenium_driver:
-                try: self.selenium_driver.quit()
-                except: pass
-                self.selenium_driver = None
+
+    def _fetch_page_rendered(self, url):
+        if self._async_loop is None:
             return None, None
+        return self._async_loop.run_until_complete(self._fetch_page_rendered_async(url))
 
     def _fetch_page_with_requests(self, url):
         try:
-            self.log_message.emit(f"Fetching (Requests): {url}", QColor(Qt.GlobalColor.darkCyan))
-            response = self.session.get(url, timeout=20)
+            self._log(f"Fetching (Requests): {url}", QColor(Qt.GlobalColor.darkCyan))
+            response = self.session.get(url, timeout=(5, 20))
             response.raise_for_status()
             return response.content, response.encoding, response.headers.get('Content-Type', '')
         except requests.exceptions.RequestException as e:
-            self.log_message.emit(f"Failed to download (Requests) {url}: {e}", QColor(Qt.GlobalColor.red))
+            self._log(f"Failed to download (Requests) {url}: {e}", QColor(Qt.GlobalColor.red))
             return None, None, None
 
+    def _ensure_dir(self, path):
+        # os.makedirs(exist_ok=True) stats every path component; cache what we
+        # have already created so per-link calls cost a set lookup instead.
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+
+    def _plan_local_path(self, absolute_link, parsed_absolute_link, tag_name, base_domain, local_file_dir):
+        """Map one linked URL to its local save location.
+
+        Returns (new_link_value, final_asset_local_path, is_asset_file,
+        link_domain, base_save_path_for_link), where new_link_value is the
+        rewritten relative href for a page saved in local_file_dir.
+        """
+        link_suffix = parsed_absolute_link.path.rpartition('.')[2].lower()
+        is_asset_file = link_suffix in _ASSET_EXTS or \
+                        tag_name in ('img', 'link', 'script', 'source', 'embed')
+
+        # base_save_path_for_link is the root directory for the link's domain
+        # (e.g., self.dest_path for same-domain, or self.dest_path/external_domain_name for others)
+        # Same normalization as base_domain: urlparse hands back the netloc
+        # raw ('Example.com:80'), which would misclassify same-site links as
+        # external against a WHATWG-normalized base.
+        link_domain = url_utils.normalize_netloc(parsed_absolute_link.netloc,
+                                                 parsed_absolute_link.scheme)
+        if link_domain == base_domain:
+            base_save_path_for_link = self.dest_path
+        else: # External domain
+            base_save_path_for_link = os.path.join(self.dest_path, sanitize_filename(link_domain))
+        self._ensure_dir(base_save_path_for_link)
+
+        asset_path_from_url = unquote(parsed_absolute_link.path)
+        asset_path_segments = [sanitize_filename(s) for s in asset_path_from_url.strip('/').split('/') if s]
+
+        asset_filename = ""
+        asset_local_dir_path_segments = []
+
+        # Determine if the linked URL points to an HTML page for filename decision
+        link_is_likely_html = link_suffix in _HTML_EXTS or absolute_link.endswith('/')
+
+        if asset_path_from_url.endswith('/') or not asset_path_segments:
+            asset_filename = "index.html"
+            asset_local_dir_path_segments = asset_path_segments
+        else:
+            potential_asset_fname = asset_path_segments[-1]
+            if '.' in potential_asset_fname:
+                asset_filename = potential_asset_fname
+                asset_local_dir_path_segments = asset_path_segments[:-1]
+            elif link_is_likely_html and not is_asset_file: # Page-like link, no extension
+                asset_filename = potential_asset_fname + ".html"
+                asset_local_dir_path_segments = asset_path_segments[:-1]
+            else: # Asset or other resource without extension
+                asset_filename = potential_asset_fname
+                asset_local_dir_path_segments = asset_path_segments[:-1]
+
+        if not asset_filename: asset_filename = "resource_default_name"
+
+        asset_save_dir = base_save_path_for_link
+        if asset_local_dir_path_segments:
+            asset_save_dir = os.path.join(base_save_path_for_link, *asset_local_dir_path_segments)
+        self._ensure_dir(asset_save_dir)
+        final_asset_local_path = os.path.join(asset_save_dir, asset_filename)
+
+        try:
+            # Both paths derive from the absolute self.dest_path
+            new_link_value = os.path.relpath(final_asset_local_path, start=local_file_dir)
+            new_link_value = new_link_value.replace(os.sep, '/')
+        except ValueError: # Should be rare if all under self.dest_path
+            self._log(f"Path error: Could not create relative path from '{local_file_dir}' to '{final_asset_local_path}'. Asset link will be broken.", QColor(Qt.GlobalColor.red))
+            new_link_value = f"#RELPATH_ERROR/{asset_filename}" # Placeholder
+
+        return new_link_value, final_asset_local_path, is_asset_file, link_domain, base_save_path_for_link
+
+    def _queue_asset(self, absolute_link, local_path, pending_assets, tag_ref=None):
+        """Register an asset URL for this page's download batch (with dedup/resume)."""
+        if absolute_link in self.downloaded_assets:
+            return
+        # In-memory dedup first (shared logos/CSS appear on every page);
+        # the stat is only a cross-run resume check.
+        try: # One stat covers both exists and non-empty
+            resume_hit = os.stat(local_path).st_size > 0
+        except OSError:
+            resume_hit = False
+        if resume_hit:
+            self.downloaded_assets.add(absolute_link)
+            return
+        if absolute_link not in pending_assets:
+            pending_assets[absolute_link] = (local_path, [])
+        if tag_ref is not None:
+            pending_assets[absolute_link][1].append(tag_ref)
+
+    async def _fetch_assets_async(self, pending_assets):
+        # pending_assets: {absolute_url: (local_path, [(tag, attr_name, original_val), ...])}
+        if self._aio_session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_workers,
+                                             limit_per_host=min(8, self.max_workers))
+            self._aio_session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+        proxy = self.proxy_settings.get('http') or self.proxy_settings.get('https') or None
+
+        async def fetch_one(url, local_path):
+            async with self._aio_semaphore:
+                if self.stop_requested:
+                    return url, None
+                try:
+                    # Same per-host politeness as the threaded path; waiting
+                    # yields the loop so other hosts keep downloading.
+                    wait = self._reserve_host_slot(get_domain(url))
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    self._log(f"Fetching (aiohttp): {url}", QColor(Qt.GlobalColor.darkCyan))
+                    # Per-phase limits like the requests paths' (5, 30): a
+                    # total= cap would abort large assets mid-transfer.
+                    timeout = aiohttp.ClientTimeout(sock_connect=5, sock_read=30)
+                    async with self._aio_session.get(url, timeout=timeout, proxy=proxy) as response:
+                        response.raise_for_status()
+                        # Stream to disk: peak memory stays at one chunk instead
+                        # of the whole asset (a large video would otherwise be
+                        # held in RAM twice).
+                        with _open_sequential(local_path) as f:
+                            async for chunk in response.content.iter_chunked(64 * 1024):
+                                f.write(chunk)
+                            return url, f.tell()
+                except Exception as e:
+                    self._log(f"Failed to download (aiohttp) {url}: {e}", QColor(Qt.GlobalColor.red))
+                    try: os.remove(local_path)
+                    except OSError: pass
+                    return url, None
+
+        return await asyncio.gather(*(fetch_one(u, p) for u, (p, _) in pending_assets.items()))
+
+    def _emit_status(self, progress=None, final=False):
+        """Emit progress/status at most ~10 times a second.
+
+        Each emission is a queued cross-thread dispatch plus several QLabel
+        updates on the GUI side; on a fast crawl the per-file rate is far
+        higher than anyone can read. Terminal updates pass final=True and
+        always go through.
+        """
+        now = time.monotonic()
+        if not final and now - self._last_status_emit < 0.1:
+            return
+        self._last_status_emit = now
+        if progress is not None:
+            self.progress_updated.emit(progress)
+        self.status_updated.emit(self.files_downloaded,
+                                 self.total_size_bytes / (1024 * 1024),
+                                 now - self.start_time)
+
+    def _reserve_host_slot(self, host):
+        """Reserve the next request slot for *host*; returns seconds to wait.
+
+        Each caller claims its slot under the lock, so concurrent downloads
+        from one host space themselves out while fetches to other hosts
+        proceed immediately. Shared by the threaded and aiohttp paths — the
+        caller decides whether to time.sleep or asyncio.sleep the wait.
+        """
+        if self.request_delay <= 0:
+            return 0.0
+        with self._host_lock:
+            now = time.monotonic()
+            start = max(now, self._host_last[host] + self.request_delay)
+            self._host_last[host] = start
+        return start - now
+
+    def _respect_host_delay(self, host):
+        """Block until a request to *host* honors the per-host delay."""
+        wait = self._reserve_host_slot(host)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _download_to_file(self, url, local_path):
+        """Stream one asset to disk via the shared session; returns its size, or None."""
+        try:
+            self._respect_host_delay(get_domain(url))
+            self._log(f"Fetching (Requests): {url}", QColor(Qt.GlobalColor.darkCyan))
+            with self.session.get(url, stream=True, timeout=(5, 30)) as response:
+                response.raise_for_status()
+                with _open_sequential(local_path) as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+                    return f.tell()
+        except requests.exceptions.RequestException as e:
+            self._log(f"Failed to download (Requests) {url}: {e}", QColor(Qt.GlobalColor.red))
+            try: os.remove(local_path)
+            except OSError: pass
+            return None
+
+    def _download_assets(self, pending_assets):
+        """Download one page's asset batch and rewrite tags whose download failed.
+
+        With aiohttp available the whole batch is fetched concurrently (the
+        fetches are I/O-bound, so this collapses the per-page asset phase to
+        roughly the slowest single download); otherwise falls back to a
+        thread pool running staggered fetches over the shared requests
+        session.
+        """
+        if not pending_assets:
+            return
+        if AIOHTTP_AVAILABLE and self._async_loop is not None and not self._proxy_is_socks:
+            results = self._async_loop.run_until_complete(self._fetch_assets_async(pending_assets))
+        else:
+            # No aiohttp: thread out the batch instead. These fetches are
+            # I/O-bound, so requests in a pool overlaps them almost as well.
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            futures = {}
+            for url, (local_path, _) in pending_assets.items():
+                if self.stop_requested:
+                    break
+                futures[self._pool.submit(self._download_to_file, url, local_path)] = url
+                if self.stagger_ms:
+                    # Staggered dispatch so a big batch doesn't slam the
+                    # network (and any single host) all at the same instant.
+                    time.sleep(self.stagger_ms / 1000.0)
+            results = [(futures[f], f.result()) for f in as_completed(futures)]
+            results.extend((url, None) for url in pending_assets
+                           if url not in set(futures.values()))
+
+        for url, size in results:
+            local_path, tag_refs = pending_assets[url]
+            if size:
+                self.downloaded_assets.add(url)
+                self.files_downloaded += 1
+                self.total_size_bytes += size
+                self.file_saved.emit(local_path)
+                self._log(f"Saved asset: {local_path}", QColor(Qt.GlobalColor.darkGreen))
+            else:
+                for tag, attr_name, original_link_val in tag_refs:
+                    tag.set(attr_name, f"#FAILED_DOWNLOAD_{original_link_val}")
+
     def run(self):
-        self.start_time = time.time()
-        self.log_message.emit(f"Starting clone: {self.base_url} to {self.dest_path}", QColor(Qt.GlobalColor.blue))
-        self.log_message.emit(f"Clone Type: {self.clone_type}, Max Depth: {self.max_depth}", QColor(Qt.GlobalColor.blue))
+        # Monotonic, to match the GUI's QElapsedTimer-based display
+        self.start_time = time.monotonic()
+        self._log(f"Starting clone: {self.base_url} to {self.dest_path}", QColor(Qt.GlobalColor.blue))
+        self._log(f"Clone Type: {self.clone_type}, Max Depth: {self.max_depth}", QColor(Qt.GlobalColor.blue))
+
+        if AIOHTTP_AVAILABLE or self.use_renderer:
+            self._async_loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._async_loop)
+            self._aio_semaphore = asyncio.Semaphore(self.max_workers)
+        if not AIOHTTP_AVAILABLE:
+            self._log("aiohttp not found. Falling back to threaded asset downloads over requests. "
+                      "For faster cloning, install with: pip install aiohttp", QColor(Qt.GlobalColor.yellow))
+        elif self._proxy_is_socks:
+            self._log("SOCKS proxy configured; aiohttp has no SOCKS support, so asset "
+                      "downloads go through requests threads.", QColor(Qt.GlobalColor.yellow))
+
+        base_domain = self.base_domain  # parsed once at construction; reused for every link
 
         try:
-            os.makedirs(self.dest_path, exist_ok=True)
+            self._ensure_dir(self.dest_path)
             # Initial URL uses self.dest_path as its current_save_base_path
             self.url_queue.append((self.base_url, 0, self.dest_path))
-            self.visited_urls.add(self.base_url)
-            
+            self.visited_urls.add(_normalize_page_url(self.base_url))
+
             initial_queue_size = 1
 
             while self.url_queue:
                 if self.stop_requested: break
-                
-                current_url, depth, current_save_base_path_for_url = self.url_queue.pop(0)
-                self.log_message.emit(f"Processing: {current_url} (depth: {depth})", QColor(Qt.GlobalColor.darkCyan))
 
-                if self.request_delay > 0 and self.files_downloaded > 0:
-                    time.sleep(self.request_delay)
+                current_url, depth, current_save_base_path_for_url = self.url_queue.popleft()
+                self._log(f"Processing: {current_url} (depth: {depth})", QColor(Qt.GlobalColor.darkCyan))
+
+                if self.files_downloaded > 0:
+                    self._respect_host_delay(get_domain(current_url))
 
                 content, encoding, content_type_header = None, None, None
-                use_selenium_for_this_url = self.use_selenium and depth == 0 # Example: only for initial page
+                use_renderer_for_this_url = self.use_renderer and depth == 0 # Example: only for initial page
 
-                if use_selenium_for_this_url:
-                    content_bytes, encoding_str = self._fetch_page_with_selenium(current_url)
+                if use_renderer_for_this_url:
+                    content_bytes, encoding_str = self._fetch_page_rendered(current_url)
                     if content_bytes:
                         content, encoding = content_bytes, encoding_str
-                        content_type_header = "text/html" # Assume for Selenium main page
+                        content_type_header = "text/html" # Assume for rendered main page
                     else:
-                        self.log_message(f"Selenium fetch failed for {current_url}, trying Requests.", QColor(Qt.GlobalColor.yellow))
+                        self._log(f"Rendered fetch failed for {current_url}, trying Requests.", QColor(Qt.GlobalColor.yellow))
                         content, encoding, content_type_header = self._fetch_page_with_requests(current_url)
                 else:
                     content, encoding, content_type_header = self._fetch_page_with_requests(current_url)
 
                 if content is None:
                     processed_count = initial_queue_size - len(self.url_queue) # Ensure this reflects actual attempts
-                    self.progress_updated.emit(int((processed_count / initial_queue_size) * 100) if initial_queue_size > 0 else 0)
+                    self._emit_status(int((processed_count / initial_queue_size) * 100) if initial_queue_size > 0 else 0)
                     continue
-                
-                is_html = False
-                if content_type_header and 'text/html' in content_type_header.lower():
-                    is_html = True
-                elif not content_type_header: # Fallback if header is missing
-                    if any(current_url.lower().endswith(ext) for ext in ['.html', '.htm', '.php']) or current_url.endswith('/'):
-                        is_html = True
-                    elif content: # Basic sniff for HTML tags if no other info
-                        try:
-                            decoded_sample = content[:1000].decode(encoding or 'utf-8', errors='ignore').lower()
-                            if '<html' in decoded_sample or '<!doctype html' in decoded_sample:
-                                is_html = True
-                        except Exception: pass
-
 
                 parsed_url = urlparse(current_url)
+                is_html = _is_html_response(content_type_header or '',
+                                            parsed_url.path.rpartition('.')[2].lower(),
+                                            parsed_url.path.endswith('/'))
+                if not is_html and not content_type_header and content:
+                    # Basic sniff for HTML tags if no other info. bytes.lower() is
+                    # ASCII-only and C-level; the tags we look for are ASCII anyway.
+                    sample = content[:1024].lower()
+                    if b'<html' in sample or b'<!doctype html' in sample:
+                        is_html = True
+
                 path_from_url = unquote(parsed_url.path)
                 path_segments = [sanitize_filename(s) for s in path_from_url.strip('/').split('/') if s]
 
@@ -261,201 +653,207 @@ class ClonerWorker(QThread):
                         filename_for_current_url = potential_filename + ".html"
                         local_dir_path_segments_for_current_url = path_segments[:-1]
                     else:
-                        filename_for_current_url = potential_filename 
+                        filename_for_current_url = potential_filename
                         local_dir_path_segments_for_current_url = path_segments[:-1]
-                
+
                 if not filename_for_current_url: # Fallback
                     filename_for_current_url = "index.html" if is_html else "resource"
-                
+
                 # local_file_dir is where the current HTML page (or resource) will be saved
                 local_file_dir = current_save_base_path_for_url
                 if local_dir_path_segments_for_current_url:
                     local_file_dir = os.path.join(current_save_base_path_for_url, *local_dir_path_segments_for_current_url)
-                
-                os.makedirs(local_file_dir, exist_ok=True)
+
+                self._ensure_dir(local_file_dir)
                 local_file_path = os.path.join(local_file_dir, filename_for_current_url)
-                
+
                 if self.files_downloaded % 10 == 0: # Disk space check
                     try:
                         _, _, free = shutil.disk_usage(os.path.dirname(self.dest_path)) # Check drive of dest_path root
-                        if free < len(content) * 2 : 
-                           self.log_message(f"Low disk space. Free: {free/1024**2:.2f}MB. Stopping.", QColor(Qt.GlobalColor.red))
+                        if free < len(content) * 2 :
+                           self._log(f"Low disk space. Free: {free/1024**2:.2f}MB. Stopping.", QColor(Qt.GlobalColor.red))
                            self.stop_requested = True; break
                     except Exception as e:
-                        self.log_message(f"Could not check disk space: {e}", QColor(Qt.GlobalColor.yellow))
+                        self._log(f"Could not check disk space: {e}", QColor(Qt.GlobalColor.yellow))
 
                 if is_html:
-                    html_content_str = content.decode(encoding or 'utf-8', errors='replace')
-                    self.page_content_downloaded.emit(current_url, html_content_str)
-                    soup = BeautifulSoup(html_content_str, 'html.parser')
-                    
-                    tags_to_process = {
-                        'a': 'href', 'link': 'href', 'iframe': 'src', 'embed': 'src', 'object': 'data',
-                        'img': ['src', 'srcset', 'data-src'], 'script': 'src', 'source': 'src', 
-                        'form': 'action' 
-                    }
-                    
+                    # lxml.html iterates the C-level element tree directly; much less
+                    # per-node overhead than bs4's Python tag wrappers on link-dense pages.
+                    # Parsing the raw bytes lets lxml sniff the charset itself and
+                    # avoids a full-page Python-level decode.
+                    # ParserError covers empty/comment-only bodies ("Document
+                    # is empty"); ValueError covers an encoding declaration
+                    # mismatch on the decoded-string retry. Either way an
+                    # unparsable page must not abort the whole crawl.
+                    try:
+                        tree = lxml.html.fromstring(content)
+                    except (lxml.etree.ParserError, ValueError):
+                        try:
+                            tree = lxml.html.fromstring(content.decode(encoding or 'utf-8', errors='replace'))
+                        except (lxml.etree.ParserError, ValueError) as e:
+                            self._log(f"Unparsable HTML at {current_url} ({e}); skipping page.", QColor(Qt.GlobalColor.yellow))
+                            continue
+
                     found_new_links_on_page = 0
-                    for tag_name, attr_names in tags_to_process.items():
-                        if not isinstance(attr_names, list): attr_names = [attr_names]
-                        
-                        for attr_name in attr_names:
-                            for tag in soup.find_all(tag_name, **{attr_name: True}):
-                                if self.stop_requested: break
-                                
-                                original_link_val = tag[attr_name]
-                                if not original_link_val or original_link_val.startswith(('data:', 'javascript:', 'mailto:', '#', 'tel:')):
-                                    continue
-
-                                current_link_to_process = original_link_val
-                                if attr_name == 'srcset': # Handle srcset: process first valid URL
-                                    links = [l.strip().split(' ')[0] for l in original_link_val.split(',')]
-                                    if not links or not links[0]: continue
-                                    current_link_to_process = links[0] # Process first link for now
-
-                                absolute_link = urljoin(current_url, current_link_to_process)
+                    # Assets found on this page, batched for concurrent download after
+                    # the tag walk: {absolute_url: (local_path, [(tag, attr, original), ...])}
+                    pending_assets = {}
+                    # The same href often appears in several tags on one page;
+                    # parse each distinct URL only once.
+                    parsed_link_cache = {}
+
+                    # urljoin re-parses current_url for every link; pre-split it
+                    # once per page and handle the absolute/root-relative/
+                    # scheme-relative cases inline, falling back to urljoin only
+                    # for relative paths ('x.css', '../x').
+                    cur_scheme = parsed_url.scheme
+                    cur_root = f"{cur_scheme}://{parsed_url.netloc}"
+
+                    def fast_join(link):
+                        if link.startswith(('http://', 'https://')):
+                            return link
+                        if link.startswith('//'):
+                            return cur_scheme + ':' + link
+                        if link.startswith('/'):
+                            return cur_root + link
+                        return urljoin(current_url, link)
+                    # Single pass in document order: each (tag, attr) pair no longer
+                    # costs its own full tree scan.
+                    for tag in tree.iter(*_TAG_ATTRS):
+                        if self.stop_requested: break
+                        tag_name = tag.tag
+
+                        for attr_name in _TAG_ATTRS[tag_name]:
+                            original_link_val = tag.get(attr_name)
+                            if not original_link_val or original_link_val.startswith(('data:', 'javascript:', 'mailto:', '#', 'tel:')):
+                                continue
+
+                            if attr_name == 'srcset':
+                                # Parse the srcset once into (url, descriptor)
+                                # pairs, put every candidate through the normal
+                                # asset pipeline, and rebuild the attribute.
+                                rewritten_candidates = []
+                                any_rewritten = False
+                                for cand_url, descriptor in _parse_srcset(original_link_val):
+                                    cand_absolute = fast_join(cand_url)
+                                    cand_parsed = parsed_link_cache.get(cand_absolute)
+                                    if cand_parsed is None:
+                                        cand_parsed = urlparse(cand_absolute)
+                                        parsed_link_cache[cand_absolute] = cand_parsed
+                                    if cand_parsed.scheme not in ('http', 'https'):
+                                        rewritten_candidates.append((cand_url, descriptor))
+                                        continue
+                                    cand_new_value, cand_local_path, _, _, _ = self._plan_local_path(
+                                        cand_absolute, cand_parsed, tag_name, base_domain, local_file_dir)
+                                    self._queue_asset(cand_absolute, cand_local_path, pending_assets)
+                                    rewritten_candidates.append((cand_new_value, descriptor))
+                                    any_rewritten = True
+                                if any_rewritten:
+                                    tag.set(attr_name, ', '.join(
+                                        f'{u} {d}' if d else u for u, d in rewritten_candidates))
+                                continue
+
+                            absolute_link = fast_join(original_link_val)
+                            parsed_absolute_link = parsed_link_cache.get(absolute_link)
+                            if parsed_absolute_link is None:
                                 parsed_absolute_link = urlparse(absolute_link)
-
-                                if parsed_absolute_link.scheme not in ['http', 'https']: continue
-
-                                is_asset_file = any(parsed_absolute_link.path.lower().endswith(ext) for ext in 
-                                               ['.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico', '.json',
-                                                '.woff', '.woff2', '.ttf', '.otf', '.eot', 
-                                                '.mp4', '.webm', '.ogg', '.mp3',
-                                                '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.xml', '.txt']) or \
-                                                tag_name in ['img', 'link', 'script', 'source', 'embed']
-
-
-                                # Determine save path for this linked resource (asset or page)
-                                link_domain = get_domain(absolute_link)
-                                # base_save_path_for_link is the root directory for the link's domain
-                                # (e.g., self.dest_path for same-domain, or self.dest_path/external_domain_name for others)
-                                if link_domain == get_domain(self.base_url):
-                                    base_save_path_for_link = self.dest_path
-                                else: # External domain
-                                    base_save_path_for_link = os.path.join(self.dest_path, sanitize_filename(link_domain))
-                                os.makedirs(base_save_path_for_link, exist_ok=True)
-                                
-                                asset_path_from_url = unquote(parsed_absolute_link.path)
-                                asset_path_segments = [sanitize_filename(s) for s in asset_path_from_url.strip('/').split('/') if s]
-                                
-                                asset_filename = ""
-                                asset_local_dir_path_segments = []
-
-                                # Determine if the linked URL points to an HTML page for filename decision
-                                link_is_likely_html = any(absolute_link.lower().endswith(ext) for ext in ['.html', '.htm', '.php']) or absolute_link.endswith('/')
-
-                                if asset_path_from_url.endswith('/') or not asset_path_segments:
-                                    asset_filename = "index.html"
-                                    asset_local_dir_path_segments = asset_path_segments
-                                else:
-                                    potential_asset_fname = asset_path_segments[-1]
-                                    if '.' in potential_asset_fname:
-                                        asset_filename = potential_asset_fname
-                                        asset_local_dir_path_segments = asset_path_segments[:-1]
-                                    elif link_is_likely_html and not is_asset_file: # Page-like link, no extension
-                                        asset_filename = potential_asset_fname + ".html"
-                                        asset_local_dir_path_segments = asset_path_segments[:-1]
-                                    else: # Asset or other resource without extension
-                                        asset_filename = potential_asset_fname
-                                        asset_local_dir_path_segments = asset_path_segments[:-1]
-
-                                if not asset_filename: asset_filename = "resource_default_name"
-                                
-                                asset_save_dir = base_save_path_for_link
-                                if asset_local_dir_path_segments:
-                                    asset_save_dir = os.path.join(base_save_path_for_link, *asset_local_dir_path_segments)
-                                os.makedirs(asset_save_dir, exist_ok=True)
-                                final_asset_local_path = os.path.join(asset_save_dir, asset_filename)
-                                
-                                new_link_value = ""
-                                try:
-                                    # Ensure paths are absolute and normalized for relpath
-                                    abs_final_asset_local_path = os.path.abspath(final_asset_local_path)
-                                    abs_local_file_dir = os.path.abspath(local_file_dir)
-                                    
-                                    new_link_value = os.path.relpath(abs_final_asset_local_path, start=abs_local_file_dir)
-                                    new_link_value = new_link_value.replace(os.sep, '/')
-                                except ValueError: # Should be rare if all under self.dest_path
-                                    self.log_message(f"Path error: Could not create relative path from '{abs_local_file_dir}' to '{abs_final_asset_local_path}'. Asset link will be broken.", QColor(Qt.GlobalColor.red))
-                                    new_link_value = f"#RELPATH_ERROR/{asset_filename}" # Placeholder
-                                
-                                if attr_name == 'srcset':
-                                     # Naive update for srcset: replace only the processed part, keep other parts if any
-                                     # A robust solution would parse and reconstruct srcset fully.
-                                     tag[attr_name] = original_link_val.replace(current_link_to_process, new_link_value)
-                                else:
-                                    tag[attr_name] = new_link_value
-
-
-                                if is_asset_file:
-                                    if not os.path.exists(final_asset_local_path) or os.path.getsize(final_asset_local_path) == 0:
-                                        asset_content, _, _ = self._fetch_page_with_requests(absolute_link) # Assets always via requests
-                                        if asset_content:
-                                            with open(final_asset_local_path, 'wb') as f: f.write(asset_content)
-                                            self.files_downloaded += 1
-                                            self.total_size_bytes += len(asset_content)
-                                            self.file_saved.emit(final_asset_local_path)
-                                            self.log_message.emit(f"Saved asset: {final_asset_local_path}", QColor(Qt.GlobalColor.darkGreen))
-                                        else: # Failed download
-                                            tag[attr_name] = f"#FAILED_DOWNLOAD_{original_link_val}"
-                                elif absolute_link not in self.visited_urls and depth < self.max_depth:
-                                    # Conditions for queuing a non-asset (HTML page) link:
-                                    # 1. Not visited.
-                                    # 2. Within max depth.
-                                    # 3. If clone_type is "recursive", it must be same domain.
-                                    # 4. If clone_type is "single_page", only queue if current depth is 0 (assets for main page).
-                                    should_queue = False
-                                    if self.clone_type == "recursive" and link_domain == get_domain(self.base_url):
-                                        should_queue = True
-                                    elif self.clone_type == "single_page" and depth == 0: # Assets are handled above, this is for linked pages from depth 0
-                                        if link_domain == get_domain(self.base_url): # single_page only follows same-domain links from main page
-                                            should_queue = True # (But assets for it are already downloaded)
-                                    
-                                    if should_queue:
-                                        self.url_queue.append((absolute_link, depth + 1, base_save_path_for_link)) # Pass the correct base save path for the link's context
-                                        self.visited_urls.add(absolute_link)
-                                        found_new_links_on_page +=1
-                                        initial_queue_size +=1
-                                elif link_domain != get_domain(self.base_url) and not is_asset_file: # External page link, not an asset, and not queueing
-                                     tag[attr_name] = absolute_link # Keep external page links absolute if not cloning them
-
-                        if self.stop_requested: break # Break from inner attr_names loop
-                    if self.stop_requested: break # Break from outer tags_to_process loop
-
-                    html_content_str = str(soup)
-                    with open(local_file_path, 'w', encoding='utf-8', errors='replace') as f:
-                        f.write(html_content_str)
-                    self.log_message.emit(f"Saved HTML: {local_file_path} ({found_new_links_on_page} new links queued)", QColor(Qt.GlobalColor.green))
+                                parsed_link_cache[absolute_link] = parsed_absolute_link
+
+                            if parsed_absolute_link.scheme not in ['http', 'https']: continue
+
+                            (new_link_value, final_asset_local_path, is_asset_file,
+                             link_domain, base_save_path_for_link) = self._plan_local_path(
+                                absolute_link, parsed_absolute_link, tag_name, base_domain, local_file_dir)
+
+                            tag.set(attr_name, new_link_value)
+
+                            # Fragment-free visited key, built from the parse we
+                            # already have: '/page' and '/page#top' must not be
+                            # crawled twice.
+                            norm_link = urlunparse((
+                                parsed_absolute_link.scheme, parsed_absolute_link.netloc,
+                                parsed_absolute_link.path, '', parsed_absolute_link.query, ''))
+
+                            if is_asset_file:
+                                self._queue_asset(absolute_link, final_asset_local_path, pending_assets,
+                                                  (tag, attr_name, original_link_val))
+                            elif norm_link not in self.visited_urls and depth < self.max_depth:
+                                # Conditions for queuing a non-asset (HTML page) link:
+                                # 1. Not visited.
+                                # 2. Within max depth.
+                                # 3. If clone_type is "recursive", it must be same domain.
+                                # 4. If clone_type is "single_page", only queue if current depth is 0 (assets for main page).
+                                should_queue = False
+                                if self.clone_type == "recursive" and link_domain == base_domain:
+                                    should_queue = True
+                                elif self.clone_type == "single_page" and depth == 0: # Assets are handled above, this is for linked pages from depth 0
+                                    if link_domain == base_domain: # single_page only follows same-domain links from main page
+                                        should_queue = True # (But assets for it are already downloaded)
+
+                                if should_queue:
+                                    self.url_queue.append((absolute_link, depth + 1, base_save_path_for_link)) # Pass the correct base save path for the link's context
+                                    self.visited_urls.add(norm_link)
+                                    found_new_links_on_page +=1
+                                    initial_queue_size +=1
+                            elif link_domain != base_domain and not is_asset_file: # External page link, not an asset, and not queueing
+                                 tag.set(attr_name, absolute_link) # Keep external page links absolute if not cloning them
+
+                    if self.stop_requested: break # Bail before saving a partially processed page
+
+                    # Fetch this page's assets before serializing, so failed-download
+                    # markers written by _download_assets end up in the saved HTML.
+                    self._download_assets(pending_assets)
+
+                    # Serialize straight to UTF-8 bytes and write them as-is;
+                    # decode only once afterwards for the preview signal.
+                    html_bytes = lxml.html.tostring(tree, encoding='utf-8', method='html',
+                                                    doctype='<!DOCTYPE html>')
+                    with _open_sequential(local_file_path) as f:
+                        f.write(html_bytes)
+                    # The preview widget only shows text; ship it the first
+                    # 64KB instead of copying a whole multi-MB page across
+                    # threads (errors='replace' absorbs a split code point).
+                    preview = html_bytes[:65536].decode('utf-8', errors='replace')
+                    if len(html_bytes) > 65536:
+                        preview += '\n... [truncated]'
+                    self.page_content_downloaded.emit(current_url, preview)
+                    self._log(f"Saved HTML: {local_file_path} ({found_new_links_on_page} new links queued)", QColor(Qt.GlobalColor.green))
                 else: # Non-HTML content (e.g. direct CSS/JS link from queue - less common)
-                    with open(local_file_path, 'wb') as f: f.write(content)
-                    self.log_message(f"Saved binary/resource: {local_file_path}", QColor(Qt.GlobalColor.green))
+                    with _open_sequential(local_file_path) as f: f.write(content)
+                    self._log(f"Saved binary/resource: {local_file_path}", QColor(Qt.GlobalColor.green))
 
                 self.files_downloaded += 1
                 self.total_size_bytes += len(content)
                 self.file_saved.emit(local_file_path)
-                
+
                 processed_count = initial_queue_size - len(self.url_queue)
-                self.progress_updated.emit(int((processed_count / initial_queue_size) * 100) if initial_queue_size > 0 else 100)
-                
-                time_elapsed = time.time() - self.start_time
-                self.status_updated.emit(self.files_downloaded, self.total_size_bytes / (1024*1024), time_elapsed)
-                
+                self._emit_status(int((processed_count / initial_queue_size) * 100) if initial_queue_size > 0 else 100)
+
                 if self.clone_type == "single_page" and depth == 0 and not found_new_links_on_page:
-                    self.log_message("Single page clone (with its assets and direct page links if any) processing complete.", QColor(Qt.GlobalColor.blue))
+                    self._log("Single page clone (with its assets and direct page links if any) processing complete.", QColor(Qt.GlobalColor.blue))
                     # Don't break immediately, let any queued assets for this single page finish from the main loop if any were added by mistake here
-            
+
         except Exception as e:
-            self.log_message.emit(f"An error occurred in worker: {e}", QColor(Qt.GlobalColor.red))
+            self._log(f"An error occurred in worker: {e}", QColor(Qt.GlobalColor.red))
             import traceback
-            self.log_message.emit(traceback.format_exc(), QColor(Qt.GlobalColor.red))
+            self._log(traceback.format_exc(), QColor(Qt.GlobalColor.red))
         finally:
-            if self.selenium_driver:
-                try: self.selenium_driver.quit()
-                except Exception: pass
-            self.selenium_driver = None
-
-            time_elapsed = time.time() - self.start_time
+            if self._async_loop is not None:
+                if self._playwright is not None:
+                    try: self._async_loop.run_until_complete(self._close_renderer())
+                    except Exception: pass
+                if self._aio_session is not None:
+                    try: self._async_loop.run_until_complete(self._aio_session.close())
+                    except Exception: pass
+                    self._aio_session = None
+                self._async_loop.close()
+                self._async_loop = None
+
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+            time_elapsed = time.monotonic() - self.start_time
             status_msg = "Completed"
             if self.stop_requested: status_msg = "Stopped by user"
             elif self.files_downloaded == 0 and not self.url_queue: status_msg = "Failed or nothing to download"
@@ -466,12 +864,17 @@ class ClonerWorker(QThread):
                 "files_downloaded": self.files_downloaded, "total_size_mb": self.total_size_bytes / (1024*1024),
                 "duration_seconds": time_elapsed, "status": status_msg
             }
+            self._log(f"Cloning process finished. Status: {status_msg}", QColor(Qt.GlobalColor.magenta))
+            self._emit_status(100, final=True)  # last state must not be throttled away
+            self._flush_log()
             self.clone_finished.emit(report)
-            self.log_message.emit(f"Cloning process finished. Status: {status_msg}", QColor(Qt.GlobalColor.magenta))
 
 
 # --- Settings Dialog ---
 class SettingsDialog(QDialog):
+    # "Header-Name: value" lines; the groups come back already trimmed.
+    _HDR_RE = re.compile(r'^\s*([^:\s]+)\s*:\s*(.*?)\s*$')
+
     def __init__(self, current_settings, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Cloner Settings")
@@ -490,22 +893,35 @@ class SettingsDialog(QDialog):
         self.proxy_ip_edit = QLineEdit(self.current_settings.get('proxy_ip', ''))
         self.proxy_ip_edit.setPlaceholderText("e.g., 127.0.0.1 or socks5://127.0.0.1")
         form_layout.addRow("Proxy IP/Hostname:", self.proxy_ip_edit)
-        
+
         self.proxy_port_edit = QLineEdit(self.current_settings.get('proxy_port', ''))
         self.proxy_port_edit.setPlaceholderText("e.g., 8080")
         form_layout.addRow("Proxy Port:", self.proxy_port_edit)
 
-        self.selenium_timeout_spin = QSpinBox()
-        self.selenium_timeout_spin.setRange(10, 300)
-        self.selenium_timeout_spin.setValue(self.current_settings.get('selenium_timeout', 30))
-        self.selenium_timeout_spin.setSuffix(" seconds")
-        form_layout.addRow("Selenium Page Load Timeout:", self.selenium_timeout_spin)
-        
+        self.render_timeout_spin = QSpinBox()
+        self.render_timeout_spin.setRange(10, 300)
+        self.render_timeout_spin.setValue(self.current_settings.get('render_timeout', 30))
+        self.render_timeout_spin.setSuffix(" seconds")
+        form_layout.addRow("Page Render Timeout:", self.render_timeout_spin)
+
         self.request_delay_spin = QSpinBox()
         self.request_delay_spin.setRange(0, 60)
         self.request_delay_spin.setValue(self.current_settings.get('request_delay', 1))
         self.request_delay_spin.setSuffix(" seconds")
-        form_layout.addRow("Delay Between Requests:", self.request_delay_spin)
+        self.request_delay_spin.setToolTip("Minimum spacing between requests to the same host. Requests to different hosts run concurrently.")
+        form_layout.addRow("Per-Host Request Delay:", self.request_delay_spin)
+
+        self.max_workers_spin = QSpinBox()
+        self.max_workers_spin.setRange(1, 64)
+        self.max_workers_spin.setValue(self.current_settings.get('max_workers', 16))
+        form_layout.addRow("Download Threads:", self.max_workers_spin)
+
+        self.stagger_spin = QSpinBox()
+        self.stagger_spin.setRange(0, 1000)
+        self.stagger_spin.setValue(self.current_settings.get('stagger_ms', 100))
+        self.stagger_spin.setSuffix(" ms")
+        self.stagger_spin.setToolTip("Offset between dispatching queued downloads, so batches don't start all at once.")
+        form_layout.addRow("Dispatch Stagger:", self.stagger_spin)
 
         self.max_depth_spin = QSpinBox()
         self.max_depth_spin.setRange(0, 50) # 0 for single page (assets only), up to 50 levels deep
@@ -529,46 +945,91 @@ class SettingsDialog(QDialog):
     def get_settings(self):
         headers = {}
         for line in self.headers_edit.toPlainText().splitlines():
-            if ':' in line:
-                key, value = line.split(":", 1)
-                headers[key.strip()] = value.strip()
+            m = self._HDR_RE.match(line)
+            if m:
+                headers[m.group(1)] = m.group(2)
         if not headers.get("User-Agent"):
              headers["User-Agent"] = DEFAULT_USER_AGENT
-             
+
         return {
             'headers': headers,
             'proxy_ip': self.proxy_ip_edit.text().strip(),
             'proxy_port': self.proxy_port_edit.text().strip(),
-            'selenium_timeout': self.selenium_timeout_spin.value(),
+            'render_timeout': self.render_timeout_spin.value(),
             'request_delay': self.request_delay_spin.value(),
+            'max_workers': self.max_workers_spin.value(),
+            'stagger_ms': self.stagger_spin.value(),
             'max_depth': self.max_depth_spin.value()
         }
 
+def _icons():
+    """Resolve the toolbar icons once per window.
+
+    QIcon.fromTheme hits the theme database (and the fallback a disk stat)
+    on every call; QIcon itself is cheap to copy afterwards. Must run after
+    the QApplication exists.
+    """
+    return {
+        'start': QIcon.fromTheme("media-playback-start", QIcon("icons/start.png")),
+        'stop': QIcon.fromTheme("media-playback-stop", QIcon("icons/stop.png")),
+        'settings': QIcon.fromTheme("preferences-system", QIcon("icons/settings.png")),
+    }
+
+
 # --- Main Application Window ---
 class WebClonerApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"{APP_NAME} - {APP_VERSION}")
         self.setGeometry(100, 100, 1280, 800) # Slightly wider
-        
-        self.settings = { 
+
+        self.settings = {
             'headers': {"User-Agent": DEFAULT_USER_AGENT},
             'proxy_ip': '', 'proxy_port': '',
-            'selenium_timeout': 30, 'request_delay': 1, 'max_depth': 5,
-            'use_selenium': False
+            'render_timeout': 30, 'request_delay': 1, 'max_depth': 5,
+            'max_workers': 16, 'stagger_ms': 100,
+            'use_renderer': False
         }
+        self._icons = _icons()
         self.cloner_worker = None
-        self.clone_start_time = 0
+        # Monotonic elapsed-time source for the status display; wall-clock
+        # time.time() jumps under NTP adjustment and skews the average speed.
+        self._clone_elapsed = QElapsedTimer()
+        self._last_hhmmss = ""       # last strings pushed to the runtime
+        self._last_status_text = ""  # labels, to skip redundant setText
 
         self.init_ui()
         self.update_status_timer = QTimer(self)
         self.update_status_timer.timeout.connect(self.update_runtime_status)
-        
-        if not SELENIUM_AVAILABLE:
-            self.use_selenium_checkbox.setDisabled(True)
-            self.use_selenium_checkbox.setToolTip("Selenium library not found. Install: pip install selenium webdriver-manager")
-            self.log_message("Selenium library not found. Dynamic content engine (Selenium) is disabled. "
-                             "For JS-heavy sites, install with: pip install selenium webdriver-manager", QColor(Qt.GlobalColor.yellow))
+
+        # GUI-side log ring buffer: log_message only enqueues; this timer
+        # drains the queue five times a second with a single append, so the
+        # log widget repaints O(5/sec) instead of once per message.
+        self._log_buf = deque()
+        self._color_css = {}  # QColor.rgba() -> css string, filled lazily
+        self._default_log_css = self.palette().color(QPalette.ColorRole.Text).name()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
+        self._log_flush_timer.start(200)
+
+        # Coalesce page-preview updates: only the most recent page is kept and
+        # the widget repaints at most 4 times a second, not once per page.
+        self._preview_pending = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._apply_preview)
+
+        # Manual directory-view refresh (runs only while cloning, and only
+        # when the Directory View tab is actually visible).
+        self._dir_root = None
+        self._dir_refresh_timer = QTimer(self)
+        self._dir_refresh_timer.timeout.connect(self._refresh_dir_view)
+
+        if not PLAYWRIGHT_AVAILABLE:
+            self.use_renderer_checkbox.setDisabled(True)
+            self.use_renderer_checkbox.setToolTip("Playwright library not found. Install: pip install playwright && playwright install chromium")
+            self.log_message("Playwright library not found. Dynamic content engine is disabled. "
+                             "For JS-heavy sites, install with: pip install playwright && playwright install chromium", QColor(Qt.GlobalColor.yellow))
 
     def init_ui(self):
         main_widget = QWidget()
@@ -581,10 +1042,17 @@ class WebClonerApp(QMainWindow):
 
         input_group = QGroupBox("Input Configuration")
         input_group_layout = QFormLayout(input_group)
-        
+
         self.url_input = QLineEdit()
         self.url_input.setPlaceholderText("Enter full URL, e.g., https://example.com")
         self.url_input.textChanged.connect(self.on_url_changed)
+        # Debounce the per-keystroke path suggestion so fast typing doesn't
+        # re-parse and re-suggest on every character.
+        self._pending_url = ""
+        self._url_debounce = QTimer(self)
+        self._url_debounce.setSingleShot(True)
+        self._url_debounce.setInterval(150)
+        self._url_debounce.timeout.connect(self._apply_url_suggestion)
         input_group_layout.addRow(QLabel("Website URL:"), self.url_input)
 
         dest_path_layout = QHBoxLayout()
@@ -595,12 +1063,12 @@ class WebClonerApp(QMainWindow):
         dest_path_layout.addWidget(self.dest_path_input)
         dest_path_layout.addWidget(self.dest_path_button)
         input_group_layout.addRow(QLabel("Destination Path:"), dest_path_layout)
-        
+
         controls_layout.addWidget(input_group)
 
         options_group = QGroupBox("Clone Options")
         options_main_layout = QVBoxLayout(options_group)
-        
+
         clone_type_layout = QHBoxLayout()
         self.single_page_radio = QRadioButton("Single Page (incl. assets, 0-depth links)")
         self.single_page_radio.setToolTip("Clones the specified URL, its assets, and links found on that page (if same domain and depth 0).")
@@ -612,43 +1080,36 @@ class WebClonerApp(QMainWindow):
         clone_type_layout.addStretch()
         options_main_layout.addLayout(clone_type_layout)
 
-        self.use_selenium_checkbox = QCheckBox("Use Dynamic Content Engine (Selenium - for JS sites, slower)")
-        self.use_selenium_checkbox.setChecked(self.settings.get('use_selenium', False))
-        self.use_selenium_checkbox.toggled.connect(lambda checked: self.settings.update({'use_selenium': checked}))
-        options_main_layout.addWidget(self.use_selenium_checkbox)
-        
+        self.use_renderer_checkbox = QCheckBox("Use Dynamic Content Engine (Playwright - for JS sites, slower)")
+        self.use_renderer_checkbox.setChecked(self.settings.get('use_renderer', False))
+        self.use_renderer_checkbox.toggled.connect(lambda checked: self.settings.update({'use_renderer': checked}))
+        options_main_layout.addWidget(self.use_renderer_checkbox)
+
         controls_layout.addWidget(options_group)
 
         action_buttons_layout = QHBoxLayout()
-        # Attempt to use standard icons with text fallbacks
-        try:
-            self.start_button = QPushButton(QIcon.fromTheme("media-playback-start", QIcon("icons/start.png")), " Start Cloning") # icon path relative
-        except: self.start_button = QPushButton("Start Cloning")
+        self.start_button = QPushButton(self._icons['start'], " Start Cloning")
         self.start_button.clicked.connect(self.start_cloning)
 
-        try:
-            self.stop_button = QPushButton(QIcon.fromTheme("media-playback-stop", QIcon("icons/stop.png")), " Stop Cloning")
-        except: self.stop_button = QPushButton("Stop Cloning")
+        self.stop_button = QPushButton(self._icons['stop'], " Stop Cloning")
         self.stop_button.setEnabled(False)
         self.stop_button.clicked.connect(self.stop_cloning)
-        
-        try:
-            self.settings_button = QPushButton(QIcon.fromTheme("preferences-system", QIcon("icons/settings.png")), " Settings")
-        except: self.settings_button = QPushButton("Settings")
+
+        self.settings_button = QPushButton(self._icons['settings'], " Settings")
         self.settings_button.clicked.connect(self.open_settings)
-        
+
         action_buttons_layout.addWidget(self.start_button)
         action_buttons_layout.addWidget(self.stop_button)
         action_buttons_layout.addStretch()
         action_buttons_layout.addWidget(self.settings_button)
         controls_layout.addLayout(action_buttons_layout)
-        
+
         main_layout.addWidget(controls_frame)
 
         main_splitter = QSplitter(Qt.Orientation.Horizontal)
         left_panel_widget = QWidget()
         left_panel_layout = QVBoxLayout(left_panel_widget)
-        
+
         self.progress_bar = QProgressBar()
         self.progress_bar.setTextVisible(True)
         self.progress_bar.setValue(0)
@@ -657,6 +1118,10 @@ class WebClonerApp(QMainWindow):
 
         self.log_output = QTextEdit()
         self.log_output.setReadOnly(True)
+        # Bound the document so appends stay O(1) over a multi-hour crawl; the
+        # undo stack is dead weight for a read-only widget.
+        self.log_output.document().setMaximumBlockCount(5000)
+        self.log_output.setUndoRedoEnabled(False)
         self.log_output.setFont(QFont("Courier New", 9))
         left_panel_layout.addWidget(QLabel("Activity Logs:"))
         left_panel_layout.addWidget(self.log_output)
@@ -665,8 +1130,9 @@ class WebClonerApp(QMainWindow):
         right_tabs = QTabWidget()
         self.preview_tab = QWidget()
         preview_layout = QVBoxLayout(self.preview_tab)
-        self.page_preview_source = QTextEdit() 
+        self.page_preview_source = QTextEdit()
         self.page_preview_source.setReadOnly(True)
+        self.page_preview_source.setUndoRedoEnabled(False)
         self.page_preview_source.setPlaceholderText("HTML source of the currently processed page will appear here...")
         self.page_preview_source.setFont(QFont("Courier New", 9))
         preview_layout.addWidget(QLabel("Live Page Preview (HTML Source):"))
@@ -675,19 +1141,19 @@ class WebClonerApp(QMainWindow):
 
         self.dir_tree_tab = QWidget()
         dir_tree_layout = QVBoxLayout(self.dir_tree_tab)
-        self.dir_model = QFileSystemModel()
-        # self.dir_model.setFilter(QDir.Filter.NoDotAndDotDot | QDir.Filter.AllDirs | QDir.Filter.Files) # More refined filter
-        self.dir_model.setRootPath(QDir.currentPath()) # Will be updated on clone start
+        # The model is built lazily on first visit to this tab — constructing
+        # QFileSystemModel here would eagerly stat a directory at startup for
+        # users who never open the Directory View.
+        self.dir_model = None
         self.dir_tree_view = QTreeView()
-        self.dir_tree_view.setModel(self.dir_model)
         self.dir_tree_view.setAnimated(False)
         self.dir_tree_view.setIndentation(15)
         self.dir_tree_view.setSortingEnabled(True)
         self.dir_tree_view.header().setStretchLastSection(False)
-        self.dir_tree_view.setColumnWidth(0, 300) # Path column wider
         dir_tree_layout.addWidget(QLabel("Cloned Files Directory Tree:"))
         dir_tree_layout.addWidget(self.dir_tree_view)
         right_tabs.addTab(self.dir_tree_tab, "Directory View")
+        right_tabs.currentChanged.connect(self._on_right_tab_changed)
 
         self.stats_tab = QWidget()
         stats_layout = QFormLayout(self.stats_tab)
@@ -702,26 +1168,32 @@ class WebClonerApp(QMainWindow):
         stats_layout.addRow("Time Elapsed:", self.time_label)
         stats_layout.addRow("Average Speed:", self.avg_speed_label)
         right_tabs.addTab(self.stats_tab, "Clone Statistics")
-        
+
+        self.right_tabs = right_tabs
         main_splitter.addWidget(right_tabs)
-        main_splitter.setSizes([450, 750]) 
+        main_splitter.setSizes([450, 750])
         main_layout.addWidget(main_splitter)
-        
+
         self.log_message(f"{APP_NAME} {APP_VERSION} started. Ready to clone.", QColor(Qt.GlobalColor.darkGray))
 
     def on_url_changed(self, text_url):
+        self._pending_url = text_url
+        self._url_debounce.start()
+
+    def _apply_url_suggestion(self):
+        text_url = self._pending_url
         # Suggest path only if user hasn't manually set one or it's empty
         if not self.dest_path_input.property("user_edited") and \
            (text_url.startswith("http://") or text_url.startswith("https://")):
             try:
-                parsed = urlparse(text_url)
+                parsed = url_utils.parse(text_url)
                 if parsed.netloc: # Basic validation that it has a domain part
                     suggested_path = get_default_save_path(text_url)
                     self.dest_path_input.setText(suggested_path)
                     self.dest_path_input.setProperty("user_edited", False) # Reset flag
             except Exception: # Malformed URL, do nothing
                 pass
-    
+
     def browse_dest_path(self):
         current_path = self.dest_path_input.text() or QDir.homePath()
         path = QFileDialog.getExistingDirectory(self, "Select Destination Directory", current_path)
@@ -737,16 +1209,56 @@ class WebClonerApp(QMainWindow):
 
     def update_runtime_status(self):
         if self.cloner_worker and self.cloner_worker.isRunning():
-            elapsed_time = time.time() - self.clone_start_time
-            self.time_label.setText(self.format_time(elapsed_time))
-            self.status_label.setText("Cloning active...")
+            # Only touch the labels when the rendered text actually changes;
+            # setText with the same string still schedules a repaint.
+            elapsed_time = self._clone_elapsed.elapsed() / 1000.0
+            hhmmss = self.format_time(elapsed_time)
+            if hhmmss != self._last_hhmmss:
+                self._last_hhmmss = hhmmss
+                self.time_label.setText(hhmmss)
+            if self._last_status_text != "Cloning active...":
+                self._last_status_text = "Cloning active..."
+                self.status_label.setText("Cloning active...")
 
     def log_message(self, message, color=None):
-        if color: self.log_output.setTextColor(color)
-        else: self.log_output.setTextColor(self.palette().color(QPalette.ColorRole.Text))
-        self.log_output.append(f"[{time.strftime('%H:%M:%S')}] {message}")
+        # Enqueue only; _flush_logs (200ms timer) does the actual append.
+        self._log_buf.append((time.strftime('%H:%M:%S'), message, color))
+
+    def _css_for(self, color):
+        # QColor.name() allocates a fresh string every call; the log only ever
+        # uses a handful of colors, so cache the CSS strings by rgba value.
+        if color is None:
+            return self._default_log_css
+        key = color.rgba()
+        css = self._color_css.get(key)
+        if css is None:
+            css = self._color_css[key] = color.name()
+        return css
+
+    def _append_log_html(self, entries):
+        """One HTML append for a list of (timestamp, message, color) entries."""
+        spans = []
+        for ts, message, color in entries:
+            text = html_escape(message).replace('\n', '<br>')
+            spans.append(f'<span style="color:{self._css_for(color)}">[{ts}] {text}</span>')
+        self.log_output.append("<br>".join(spans))
         self.log_output.ensureCursorVisible() # Scroll to bottom
 
+    def _flush_logs(self):
+        if not self._log_buf:
+            return
+        entries = []
+        while self._log_buf:
+            entries.append(self._log_buf.popleft())
+        self._append_log_html(entries)
+
+    def append_log_batch(self, batch):
+        # Batched worker logs: one cross-thread dispatch and one HTML append
+        # per batch; colors resolve through the cached CSS table, so no
+        # per-message QTextCharFormat merges.
+        ts = time.strftime('%H:%M:%S')
+        self._append_log_html([(ts, message, color) for message, color in batch])
+
     def update_progress(self, value):
         self.progress_bar.setValue(value)
 
@@ -762,26 +1274,76 @@ class WebClonerApp(QMainWindow):
 
 
     def update_page_preview(self, url, html_content):
+        self._preview_pending = (url, html_content)
+        if not self._preview_timer.isActive():
+            self._preview_timer.start(250)
+
+    def _apply_preview(self):
+        if self._preview_pending is None:
+            return
+        url, html_content = self._preview_pending
+        self._preview_pending = None
         self.page_preview_source.setPlainText(f"-- Preview for {url} --\n\n{html_content}")
         # self.log_message(f"Preview updated for {url}", QColor(Qt.GlobalColor.darkMagenta))
 
+    def _ensure_dir_model(self):
+        """Construct the directory model on first use (lazy: see init_ui)."""
+        if self.dir_model is not None:
+            return
+        self.dir_model = QFileSystemModel()
+        # The native watcher stats every file the worker creates — thousands of
+        # change events during a fast clone. Watch nothing; a throttled timer
+        # refreshes the view instead (and only while this tab is visible).
+        self.dir_model.setOption(QFileSystemModel.Option.DontWatchForChanges, True)
+        # self.dir_model.setFilter(QDir.Filter.NoDotAndDotDot | QDir.Filter.AllDirs | QDir.Filter.Files) # More refined filter
+        self.dir_tree_view.setModel(self.dir_model)
+        self.dir_tree_view.setColumnWidth(0, 300) # Path column wider
+        root = self._dir_root or self.dest_path_input.text() or QDir.homePath()
+        index = self.dir_model.setRootPath(root)
+        self.dir_tree_view.setRootIndex(index)
+
+    def _on_right_tab_changed(self, _index):
+        if self.right_tabs.currentWidget() is self.dir_tree_tab:
+            self._ensure_dir_model()
+
     def update_directory_view(self, root_path):
         if not os.path.exists(root_path):
             self.log_message(f"Directory view path does not exist: {root_path}", QColor(Qt.GlobalColor.yellow))
             return
+        self._dir_root = root_path
+        if self.dir_model is None: # Tab never opened; remember the root for later
+            return
         index = self.dir_model.setRootPath(root_path)
         self.dir_tree_view.setRootIndex(index)
         self.dir_tree_view.scrollTo(index) # Ensure root is visible
         # self.log_message(f"Directory view monitoring: {root_path}", QColor(Qt.GlobalColor.darkMagenta))
 
+    def _refresh_dir_view(self):
+        # With DontWatchForChanges set, new files only show up when the root
+        # path is re-set; do so every tick, but skip it when the tab is hidden.
+        if not self._dir_root or self.right_tabs.currentWidget() is not self.dir_tree_tab:
+            return
+        self._ensure_dir_model()
+        self.dir_model.setRootPath('')
+        index = self.dir_model.setRootPath(self._dir_root)
+        self.dir_tree_view.setRootIndex(index)
+
 
     def clone_finished_report(self, report):
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
         self.settings_button.setEnabled(True)
-        self.use_selenium_checkbox.setEnabled(SELENIUM_AVAILABLE)
+        self.use_renderer_checkbox.setEnabled(PLAYWRIGHT_AVAILABLE)
         self.progress_bar.setValue(100)
         self.update_status_timer.stop()
+        self._dir_refresh_timer.stop()
+        if self._dir_root and self.dir_model is not None:
+            # One final refresh so the finished tree is complete
+            index = self.dir_model.setRootPath(self._dir_root)
+            self.dir_tree_view.setRootIndex(index)
+        if getattr(self, '_clone_session', None) is not None:
+            self._clone_session.close()
+            self._clone_session = None
         self.status_label.setText(report['status'])
         self.time_label.setText(self.format_time(report['duration_seconds'])) # Final time from worker
 
@@ -798,15 +1360,19 @@ class WebClonerApp(QMainWindow):
         self.log_message(full_report_msg, QColor(Qt.GlobalColor.darkGreen))
         QMessageBox.information(self, report_msg_title, report_msg_details)
 
-        self.log_message("---------------------------------------------------------", QColor(Qt.GlobalColor.blue))
-        self.log_message("RECOMMENDATION FOR VIEWING THE CLONED SITE:", QColor(Qt.GlobalColor.blue))
-        self.log_message("For best results and to avoid browser security errors (like CORS for 'file:///' links), "
-                         "view the cloned site using a local HTTP server.", QColor(Qt.GlobalColor.blue))
-        self.log_message(f"1. Open a terminal or command prompt.", QColor(Qt.GlobalColor.blue))
-        self.log_message(f"2. Navigate into the cloned site's main folder: cd \"{report['destination']}\"", QColor(Qt.GlobalColor.blue))
-        self.log_message(f"3. Run a simple server. If Python is installed: python -m http.server", QColor(Qt.GlobalColor.blue))
-        self.log_message(f"4. Open your browser to: http://localhost:8000 (or the address shown in terminal).", QColor(Qt.GlobalColor.blue))
-        self.log_message("---------------------------------------------------------", QColor(Qt.GlobalColor.blue))
+        # One log call for the whole block: one append/repaint instead of eight.
+        recommendation = "\n".join([
+            "---------------------------------------------------------",
+            "RECOMMENDATION FOR VIEWING THE CLONED SITE:",
+            "For best results and to avoid browser security errors (like CORS for 'file:///' links), "
+            "view the cloned site using a local HTTP server.",
+            "1. Open a terminal or command prompt.",
+            f"2. Navigate into the cloned site's main folder: cd \"{report['destination']}\"",
+            "3. Run a simple server. If Python is installed: python -m http.server",
+            "4. Open your browser to: http://localhost:8000 (or the address shown in terminal).",
+            "---------------------------------------------------------",
+        ])
+        self.log_message(recommendation, QColor(Qt.GlobalColor.blue))
 
 
     def open_settings(self):
@@ -819,16 +1385,22 @@ class WebClonerApp(QMainWindow):
         base_url = self.url_input.text().strip()
         dest_path = self.dest_path_input.text().strip()
 
-        if not (base_url.startswith("http://") or base_url.startswith("https://")) or "." not in urlparse(base_url).netloc:
+        # Parse once; the result is reused for validation and handed to the
+        # worker so the base URL is never parsed again.
+        try:
+            parsed_base = url_utils.parse(base_url)
+        except ValueError:
+            parsed_base = None
+        if parsed_base is None or parsed_base.scheme not in ('http', 'https') or '.' not in parsed_base.netloc:
             QMessageBox.warning(self, "Invalid URL", "Please enter a valid URL (e.g., http://example.com).")
             return
-        
+
         if not dest_path:
             self.log_message("Destination path is empty. Attempting to auto-generate.", QColor(Qt.GlobalColor.yellow))
             dest_path = get_default_save_path(base_url)
             self.dest_path_input.setText(dest_path)
             self.log_message(f"Using auto-generated destination: {dest_path}", QColor(Qt.GlobalColor.blue))
-        
+
         try:
             os.makedirs(dest_path, exist_ok=True)
         except OSError as e:
@@ -850,59 +1422,71 @@ class WebClonerApp(QMainWindow):
 
 
         clone_type = "recursive" if self.recursive_radio.isChecked() else "single_page"
-        
-        self.update_directory_view(dest_path) 
+
+        self.update_directory_view(dest_path)
 
         proxy_config = {}
         if self.settings['proxy_ip'] and self.settings['proxy_port']:
-            # Selenium takes proxy as "host:port" or "scheme://host:port"
             # Requests takes {'http': 'http://host:port', 'https': 'http://host:port'}
             # or {'http': 'socks5://host:port', 'https': 'socks5://host:port'}
             proxy_ip = self.settings['proxy_ip']
             proxy_port = self.settings['proxy_port']
-            
-            # For requests, always prepend http:// for http/https proxies if no scheme given
-            # SOCKS proxies need explicit scheme for requests. Selenium infers sometimes.
+
+            # For requests, always prepend http:// for http/https proxies if no scheme given.
+            # SOCKS proxies need an explicit scheme.
             if "://" in proxy_ip: # User provided scheme e.g. socks5://
                  proxy_url_for_requests = f"{proxy_ip}:{proxy_port}"
-                 proxy_url_for_selenium = f"{proxy_ip}:{proxy_port}" # Selenium also takes scheme
-            else: # No scheme, assume http for requests, direct for selenium
+            else: # No scheme, assume http
                  proxy_url_for_requests = f"http://{proxy_ip}:{proxy_port}"
-                 proxy_url_for_selenium = f"{proxy_ip}:{proxy_port}" # Selenium often works without scheme for http/s
 
             proxy_config['http'] = proxy_url_for_requests
             proxy_config['https'] = proxy_url_for_requests # Requests usually uses http:// for https proxies too
                                                         # unless it's a specific https proxy server.
-            # For Selenium, it's set in _init_selenium_driver using just one proxy string.
-            # So we pass the raw parts, and selenium worker will format.
-            # The self.proxy_settings in worker will take what we put in proxy_config here.
+            # The Playwright renderer derives its single proxy server string from
+            # this dict in _ensure_renderer.
+
+        # Session owned by the GUI so clone_finished_report can release its
+        # connection pool after the worker thread has finished.
+        self._clone_session = _build_session(self.settings['headers'], proxy_config)
 
         self.cloner_worker = ClonerWorker(
-            base_url, dest_path, clone_type, 
+            base_url, dest_path, clone_type,
             headers=self.settings['headers'],
-            use_selenium=self.settings['use_selenium'],
-            selenium_timeout=self.settings['selenium_timeout'],
+            use_renderer=self.settings['use_renderer'],
+            render_timeout=self.settings['render_timeout'],
             request_delay=self.settings['request_delay'],
-            proxy_settings=proxy_config, # Pass the dict for requests, selenium worker will adapt
-            max_depth=self.settings['max_depth']
+            max_workers=self.settings['max_workers'],
+            stagger_ms=self.settings['stagger_ms'],
+            proxy_settings=proxy_config, # Pass the dict for requests; renderer adapts it
+            max_depth=self.settings['max_depth'],
+            session=self._clone_session,
+            base_parsed=parsed_base
         )
-        self.cloner_worker.log_message.connect(self.log_message)
-        self.cloner_worker.progress_updated.connect(self.update_progress)
-        self.cloner_worker.status_updated.connect(self.update_status)
-        self.cloner_worker.page_content_downloaded.connect(self.update_page_preview)
+        # All of these cross the worker->GUI thread boundary; say so explicitly
+        # rather than paying AutoConnection's per-emit thread check.
+        queued = Qt.ConnectionType.QueuedConnection
+        self.cloner_worker.log_batch.connect(self.append_log_batch, queued)
+        self.cloner_worker.progress_updated.connect(self.update_progress, queued)
+        self.cloner_worker.status_updated.connect(self.update_status, queued)
+        self.cloner_worker.page_content_downloaded.connect(self.update_page_preview, queued)
         # QFileSystemModel auto-updates, direct signal for file_saved not strictly needed for tree view
         # self.cloner_worker.file_saved.connect(lambda path: self.log_message(f"File saved: {path}", QColor(Qt.GlobalColor.gray)))
-        self.cloner_worker.clone_finished.connect(self.clone_finished_report)
-        
-        self.clone_start_time = time.time()
-        self.update_status_timer.start(1000) # Update UI time every second
+        self.cloner_worker.clone_finished.connect(self.clone_finished_report, queued)
+
+        self._clone_elapsed.start()
+        self._last_hhmmss = ""
+        self._last_status_text = ""
+        # 500ms keeps second-granularity output from visibly skipping while
+        # the changed-text check above makes the extra ticks nearly free.
+        self.update_status_timer.start(500)
+        self._dir_refresh_timer.start(2000)
         self.cloner_worker.start()
 
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
         self.settings_button.setEnabled(False)
-        if self.settings['use_selenium'] and SELENIUM_AVAILABLE: # Check SELENIUM_AVAILABLE again
-            self.use_selenium_checkbox.setEnabled(False)
+        if self.settings['use_renderer'] and PLAYWRIGHT_AVAILABLE: # Check PLAYWRIGHT_AVAILABLE again
+            self.use_renderer_checkbox.setEnabled(False)
 
 
     def stop_cloning(self):
@@ -923,7 +1507,17 @@ class WebClonerApp(QMainWindow):
             if reply == QMessageBox.StandardButton.Yes:
                 self.log_message("Application quit requested during active clone. Stopping worker...", QColor(Qt.GlobalColor.yellow))
                 self.stop_cloning()
-                if not self.cloner_worker.wait(7000): # Wait up to 7s for graceful thread termination
+                # Wait up to 7s for graceful termination without blocking the
+                # GUI thread: a local event loop keeps the window painting
+                # (QThread.wait() here made the app look hung on quit).
+                if self.cloner_worker.isRunning():
+                    self.setEnabled(False)
+                    wait_loop = QEventLoop()
+                    self.cloner_worker.finished.connect(wait_loop.quit)
+                    QTimer.singleShot(7000, wait_loop.quit)
+                    wait_loop.exec()
+                    self.setEnabled(True)
+                if self.cloner_worker.isRunning():
                     self.log_message("Worker thread did not terminate gracefully within timeout.", QColor(Qt.GlobalColor.red))
                 event.accept()
             else:
@@ -937,18 +1531,18 @@ if __name__ == '__main__':
     app.setStyle("Fusion") # Apply Fusion style for better cross-platform consistency
 
     # Create dummy icon files if they don't exist for testing purposes
-    # In a real deployment, these should be proper icons.
-    os.makedirs("icons", exist_ok=True)
-    for icon_name in ["start.png", "stop.png", "settings.png"]:
-        icon_path = os.path.join("icons", icon_name)
-        if not os.path.exists(icon_path):
-            try: # Create a tiny placeholder if QPixmap is available early, or skip
-                from PyQt6.QtGui import QPixmap
-                pixmap = QPixmap(16,16)
+    # In a real deployment, these should be proper icons. A sentinel file
+    # makes this a single stat on every launch after the first.
+    icons_sentinel = os.path.join("icons", ".generated")
+    if not os.path.exists(icons_sentinel):
+        os.makedirs("icons", exist_ok=True)
+        for icon_name in ["start.png", "stop.png", "settings.png"]:
+            icon_path = os.path.join("icons", icon_name)
+            if not os.path.exists(icon_path):
+                pixmap = QPixmap(16, 16)
                 pixmap.fill(Qt.GlobalColor.transparent) # or some color
                 pixmap.save(icon_path)
-            except:
-                pass # Cannot create placeholder icon
+        open(icons_sentinel, 'w').close()
 
     main_win = WebClonerApp()
     main_win.show()